@@ -15,318 +15,894 @@ Date:   2025-07-30
 Version:0.2.2
 """
 
-from typing import Any, List, Optional, TextIO
+import contextlib
+import functools
+import io
+import operator
+import os
+import sys
+from types import MappingProxyType
+from typing import Any, Callable, Iterator, List, Mapping, Optional, TextIO, Tuple
+
+# RGB mappings for the predefined HTML-safe color names. Read-only so the
+# precomputed escape tables below can never drift out of sync with it.
+COLOR_RGB = MappingProxyType({
+    "aliceblue": (240, 248, 255),
+    "antiquewhite": (250, 235, 215),
+    "aqua": (0, 255, 255),
+    "aquamarine": (127, 255, 212),
+    "azure": (240, 255, 255),
+    "bisque": (255, 228, 196),
+    "blanchedalmond": (255, 235, 205),
+    "blue": (0, 0, 255),
+    "blueviolet": (138, 43, 226),
+    "brown": (165, 42, 42),
+    "burlywood": (222, 184, 135),
+    "cadetblue": (95, 158, 160),
+    "chartreuse": (127, 255, 0),
+    "chocolate": (210, 105, 30),
+    "coral": (255, 127, 80),
+    "cornflowerblue": (100, 149, 237),
+    "cornsilk": (255, 248, 220),
+    "crimson": (220, 20, 60),
+    "cyan": (0, 255, 255),
+    "darkblue": (0, 0, 139),
+    "darkcyan": (0, 139, 139),
+    "darkgray": (169, 169, 169),
+    "darkgreen": (0, 100, 0),
+    "darkgrey": (169, 169, 169),
+    "darkkhaki": (189, 183, 107),
+    "darkmagenta": (139, 0, 139),
+    "darkolivegreen": (85, 107, 47),
+    "darkorange": (255, 140, 0),
+    "darkorchid": (153, 50, 204),
+    "darkred": (139, 0, 0),
+    "darksalmon": (233, 150, 122),
+    "darkseagreen": (143, 188, 139),
+    "darkslateblue": (72, 61, 139),
+    "darkslategray": (47, 79, 79),
+    "darkslategrey": (47, 79, 79),
+    "darkturquoise": (0, 206, 209),
+    "darkviolet": (148, 0, 211),
+    "deeppink": (255, 20, 147),
+    "deepskyblue": (0, 191, 255),
+    "dimgray": (105, 105, 105),
+    "dimgrey": (105, 105, 105),
+    "dodgerblue": (30, 144, 255),
+    "firebrick": (178, 34, 34),
+    "floralwhite": (255, 250, 240),
+    "forestgreen": (34, 139, 34),
+    "fuchsia": (255, 0, 255),
+    "gainsboro": (220, 220, 220),
+    "ghostwhite": (248, 248, 255),
+    "gold": (255, 215, 0),
+    "gray": (128, 128, 128),
+    "green": (0, 128, 0),
+    "greenyellow": (173, 255, 47),
+    "grey": (128, 128, 128),
+    "honeydew": (240, 255, 240),
+    "hotpink": (255, 105, 180),
+    "indianred": (205, 92, 92),
+    "indigo": (75, 0, 130),
+    "ivory": (255, 255, 240),
+    "khaki": (240, 230, 140),
+    "lavender": (230, 230, 250),
+    "lavenderblush": (255, 240, 245),
+    "lawngreen": (124, 252, 0),
+    "lemonchiffon": (255, 250, 205),
+    "lightblue": (173, 216, 230),
+    "lightcoral": (240, 128, 128),
+    "lightcyan": (224, 255, 255),
+    "lightgoldenrodyellow": (250, 250, 210),
+    "lightgray": (211, 211, 211),
+    "lightgreen": (144, 238, 144),
+    "lightgrey": (211, 211, 211),
+    "lightpink": (255, 182, 193),
+    "lightsalmon": (255, 160, 122),
+    "lightseagreen": (32, 178, 170),
+    "lightskyblue": (135, 206, 250),
+    "lightslategray": (119, 136, 153),
+    "lightslategrey": (119, 136, 153),
+    "lightsteelblue": (176, 196, 222),
+    "lightyellow": (255, 255, 224),
+    "lime": (0, 255, 0),
+    "limegreen": (50, 205, 50),
+    "linen": (250, 240, 230),
+    "magenta": (255, 0, 255),
+    "mediumaquamarine": (102, 205, 170),
+    "mediumblue": (0, 0, 205),
+    "mediumorchid": (186, 85, 211),
+    "mediumpurple": (147, 112, 219),
+    "mediumseagreen": (60, 179, 113),
+    "mediumslateblue": (123, 104, 238),
+    "mediumspringgreen": (0, 250, 154),
+    "mediumturquoise": (72, 209, 204),
+    "mediumvioletred": (199, 21, 133),
+    "midnightblue": (25, 25, 112),
+    "mintcream": (245, 255, 250),
+    "mistyrose": (255, 228, 225),
+    "moccasin": (255, 228, 181),
+    "navy": (0, 0, 128),
+    "oldlace": (253, 245, 230),
+    "olive": (128, 128, 0),
+    "olivedrab": (107, 142, 35),
+    "orange": (255, 165, 0),
+    "orangered": (255, 69, 0),
+    "orchid": (218, 112, 214),
+    "palegoldenrod": (238, 232, 170),
+    "palegreen": (152, 251, 152),
+    "paleturquoise": (175, 238, 238),
+    "palevioletred": (219, 112, 147),
+    "papayawhip": (255, 239, 213),
+    "peachpuff": (255, 218, 185),
+    "peru": (205, 133, 63),
+    "pink": (255, 192, 203),
+    "plum": (221, 160, 221),
+    "powderblue": (176, 224, 230),
+    "purple": (128, 0, 128),
+    "rebeccapurple": (102, 51, 153),
+    "red": (255, 0, 0),
+    "rosybrown": (188, 143, 143),
+    "royalblue": (65, 105, 225),
+    "saddlebrown": (139, 69, 19),
+    "salmon": (250, 128, 114),
+    "sandybrown": (244, 164, 96),
+    "seagreen": (46, 139, 87),
+    "seashell": (255, 245, 238),
+    "sienna": (160, 82, 45),
+    "silver": (192, 192, 192),
+    "skyblue": (135, 206, 235),
+    "slateblue": (106, 90, 205),
+    "slategray": (112, 128, 144),
+    "slategrey": (112, 128, 144),
+    "snow": (255, 250, 250),
+    "springgreen": (0, 255, 127),
+    "steelblue": (70, 130, 180),
+    "tan": (210, 180, 140),
+    "teal": (0, 128, 128),
+    "thistle": (216, 191, 216),
+    "tomato": (255, 99, 71),
+    "turquoise": (64, 224, 208),
+    "violet": (238, 130, 238),
+    "wheat": (245, 222, 179),
+    "white": (255, 255, 255),
+    "whitesmoke": (245, 245, 245),
+    "yellow": (255, 255, 0),
+    "yellowgreen": (154, 205, 50)
+})
+
+
+# ANSI escape code templates
+ANSI_BASE = "\x1b[{code}m"
+RGB_FOREGROUND = "\x1b[38;2;{r};{g};{b}m"
+RGB_BACKGROUND = "\x1b[48;2;{r};{g};{b}m"
+HYPERLINK = "\x1B]8;;{hyperlink}\x1B\\{text}\x1B]8;;\x1B\\"
+
+# Fully built reset sequence, so printing does not format it every call
+RESET_SEQ = "\x1b[0m"
+
+# Prefix to mark background-color formats
+BACK_TAG = "back_"
+
+# Default settings
+DEFAULT_COLOR = "white"
+
+# ANSI codes for text styles
+FORMAT_CODES = {
+    "reset": "0",
+    "bold": "1",
+    "dim": "2",
+    "italic": "3",
+    "underline": "4",
+    "blink": "5",
+    "inverse": "7",
+    "hidden": "8",
+    "strikethrough": "9",
+}
+
+# Fully built ANSI sequences for text styles
+FORMAT_ANSI = {key: f"\x1b[{code}m" for key, code in FORMAT_CODES.items()}
+
+# SGR parameters for every named color ("38;2;r;g;b" / "48;2;r;g;b"), so
+# styles and colors can be merged into a single escape sequence.
+FG_PARAMS = {name: f"38;2;{r};{g};{b}" for name, (r, g, b) in COLOR_RGB.items()}
+BG_PARAMS = {name: f"48;2;{r};{g};{b}" for name, (r, g, b) in COLOR_RGB.items()}
+# Upper-case aliases (e.g. "RED") so those also resolve without normalizing.
+FG_PARAMS.update({name.upper(): params for name, params in FG_PARAMS.items()})
+BG_PARAMS.update({name.upper(): params for name, params in BG_PARAMS.items()})
+
+# Precomputed ANSI sequences for every named color, built once at import so the
+# named-color paths only need a dict lookup instead of formatting a template.
+FG_ANSI = {name: f"\x1b[{params}m" for name, params in FG_PARAMS.items()}
+BG_ANSI = {name: f"\x1b[{params}m" for name, params in BG_PARAMS.items()}
+
+# The named-color escapes pre-encoded (they are pure ASCII), for the byte-level
+# write path that skips the text encoder for the escape codes.
+FG_ANSI_B = {name: seq.encode("ascii") for name, seq in FG_ANSI.items()}
+BG_ANSI_B = {name: seq.encode("ascii") for name, seq in BG_ANSI.items()}
+
+# SGR parameters for every combination of the eight text styles, indexed by
+# a bitmask: bold=1, dim=2, italic=4, underline=8, blink=16, inverse=32,
+# hidden=64, strikethrough=128. E.g. STYLE_PARAMS[1 | 4] == "1;3".
+STYLE_BITS = ("bold", "dim", "italic", "underline", "blink", "inverse",
+              "hidden", "strikethrough")
+STYLE_PARAMS = tuple(
+    ";".join(FORMAT_CODES[style]
+             for bit, style in enumerate(STYLE_BITS) if mask >> bit & 1)
+    for mask in range(1 << len(STYLE_BITS))
+)
+
+
+def _detect_color() -> bool:
+    """Whether escape codes should be written by default.
+
+    Color is off when stdout is not a terminal (piped or redirected), when the
+    NO_COLOR environment variable is set, or when TERM is "dumb". A non-empty
+    FORCE_COLOR (other than "0" or "false") turns it on regardless.
+    """
+    force = os.environ.get("FORCE_COLOR", "")
+    if force and force.lower() not in ("0", "false"):
+        return True
+    if os.environ.get("NO_COLOR") or os.environ.get("TERM") == "dumb":
+        return False
+    isatty = getattr(sys.stdout, "isatty", None)
+    return bool(isatty and isatty())
+
+
+# Checked by every print path at call time; when False only the plain text is
+# written. Detected once at import, overridden with _set_color_enabled().
+_color_enabled = _detect_color()
+
+
+def _set_color_enabled(enabled: Optional[bool] = True) -> None:
+    """Turn escape codes on or off, or pass None to detect again from stdout."""
+    global _color_enabled
+    _color_enabled = _detect_color() if enabled is None else bool(enabled)
+
+
+# (stream, prefix) of the innermost active styled() block, None outside of one.
+_active_style = None
+
+
+def _reset_suffix(file: TextIO) -> str:
+    """Reset written after styled text on file.
+
+    Inside a styled() block on the same stream the block's style is put back
+    right after the reset, so a print call in the block doesn't end it early.
+    """
+    active = _active_style
+    if active is not None and active[0] is file:
+        return RESET_SEQ + active[1]
+    return RESET_SEQ
+
+
+@contextlib.contextmanager
+def _styled(*,
+            file: Optional[TextIO] = None,
+            bold: bool = False,
+            dim: bool = False,
+            italic: bool = False,
+            underline: bool = False,
+            blink: bool = False,
+            inverse: bool = False,
+            hidden: bool = False,
+            strikethrough: bool = False,
+            color: str = "",
+            back_color: str = "") -> Iterator[None]:
+    """Apply styles to everything printed to file inside the block.
+
+    The prefix is written once on entry and reset once on exit. Nothing is
+    written when color is disabled or no style applies (e.g. an unknown
+    color and no flags). While the block is active, the print paths reset
+    to its style through _reset_suffix().
+
+    Args:
+        file (TextIO, optional): Output stream (defaults to sys.stdout).
+        bold, dim, italic, underline, blink, inverse, hidden, strikethrough
+            (bool): Text style flags.
+        color (str): Named foreground color.
+        back_color (str): Named background color.
+    """
+    global _active_style
+    prefix = _style_prefix(bold, dim, italic, underline, blink, inverse,
+                           hidden, strikethrough, color, back_color)
+    if not (prefix and _color_enabled):
+        yield
+        return
+    stream = sys.stdout if file is None else file
+    previous = _active_style
+    stream.write(prefix)
+    _active_style = (stream, prefix)
+    try:
+        yield
+    finally:
+        _active_style = previous
+        # Reset, then restore the enclosing block's style when nested
+        stream.write(_reset_suffix(stream))
+
+
+def _rgb_components(r: int, g: int, b: int) -> Tuple[int, int, int]:
+    """Return the components as plain ints, or raise TypeError for non-integers.
+
+    operator.index() takes ints, bools and integer-like types such as numpy
+    integers, but not floats, which would otherwise work only by accident.
+    """
+    try:
+        return operator.index(r), operator.index(g), operator.index(b)
+    except TypeError:
+        raise TypeError(
+            f"RGB components must be integers, got ({r!r}, {g!r}, {b!r})") from None
+
+
+def _build_ansi_sequence(*, fg: bool = True, r: int = 0, g: int = 0,
+                         b: int = 0) -> str:
+    """Build an ANSI sequence for an RGB color.
+
+    Results are cached, so a loop printing the same custom RGB colors only
+    formats each escape once.
+
+    Args:
+        fg (bool): True for foreground, False for background.
+        r (int): Red component (0–255).
+        g (int): Green component (0–255).
+        b (int): Blue component (0–255).
+
+    Returns:
+        str: ANSI escape sequence for the specified RGB color.
+
+    Raises:
+        TypeError: If a component is not an integer.
+        ValueError: If a component is outside 0–255.
+    """
+    # Coerced before the cache, so 1.0 can't hit an entry cached for 1
+    return _rgb_sequence(fg, *_rgb_components(r, g, b))
+
+
+@functools.lru_cache(maxsize=1024)
+def _rgb_sequence(fg: bool, r: int, g: int, b: int) -> str:
+    """Cached body of _build_ansi_sequence(), for components already coerced.
+
+    core.print_rgb() and print_rgb_options() look escapes up here directly.
+    """
+    # Any bit above the low byte (or a negative sign) means out of range
+    if (r | g | b) & ~0xFF:
+        raise ValueError(f"RGB components must be in the range 0-255, got ({r}, {g}, {b})")
+    # f-string rather than RGB_FOREGROUND/RGB_BACKGROUND.format(), which
+    # re-parses the template on every call
+    return f"\x1b[{'38' if fg else '48'};2;{r};{g};{b}m"
+
+
+def _collect_codes(formats: List[str]) -> List[str]:
+    """Convert style names and color tags into ANSI code sequences.
+
+    Args:
+        formats (List[str]): List of style keywords or color tags.
+
+    Returns:
+        List[str]: Corresponding list of ANSI sequences.
+    """
+    codes: List[str] = []
+    for fmt in formats:
+        # Canonical style keyword or color name, no normalizing needed
+        if (seq := FORMAT_ANSI.get(fmt)) is not None:
+            codes.append(seq)
+            continue
+        if (seq := FG_ANSI.get(fmt)) is not None:
+            codes.append(seq)
+            continue
+        key = fmt.strip().lower()
+        if (seq := FORMAT_ANSI.get(key)) is not None:
+            # Text style (bold, underline, reset, etc.)
+            codes.append(seq)
+        elif key.startswith(BACK_TAG):
+            # Background color, looked up from the precomputed table
+            if (seq := BG_ANSI.get(key[len(BACK_TAG):])) is not None:
+                codes.append(seq)
+        elif (seq := FG_ANSI.get(key)) is not None:
+            # Foreground color
+            codes.append(seq)
+    return codes
+
+
+def _style_prefix(bold: bool, dim: bool, italic: bool, underline: bool,
+                  blink: bool, inverse: bool, hidden: bool, strikethrough: bool,
+                  color: str, back_color: str) -> str:
+    """Build the ANSI prefix for a set of style flags and named colors.
+
+    Args:
+        bold, dim, italic, underline, blink, inverse, hidden, strikethrough
+            (bool): Text style flags.
+        color (str): Named foreground color, ignored if unknown.
+        back_color (str): Named background color, ignored if unknown.
+
+    Returns:
+        str: Combined ANSI sequence, or "" if nothing applies.
+    """
+    # Map boolean flags to a bitmask indexing the precomputed style parameters
+    mask = ((1 if bold else 0) | (2 if dim else 0) | (4 if italic else 0) |
+            (8 if underline else 0) | (16 if blink else 0) |
+            (32 if inverse else 0) | (64 if hidden else 0) |
+            (128 if strikethrough else 0))
+
+    return _sgr_prefix(mask, color, back_color)
+
+
+@functools.lru_cache(maxsize=1024)
+def _sgr_prefix(mask: int, color: str, back_color: str) -> str:
+    """Single combined SGR sequence for a style bitmask and color pair, cached.
+
+    All attributes go into one "ESC[1;3;38;2;r;g;bm" sequence rather than one
+    sequence per attribute, which is fewer bytes for the terminal to parse.
+
+    Args:
+        mask (int): Style bitmask, see STYLE_PARAMS.
+        color (str): Named foreground color, ignored if unknown.
+        back_color (str): Named background color, ignored if unknown.
+
+    Returns:
+        str: The SGR sequence, or "" if nothing applies.
+    """
+    # Add named colors if valid, only normalizing names that miss as given
+    fg = FG_PARAMS.get(color)
+    if fg is None:
+        fg = FG_PARAMS.get(color.strip().lower(), "")
+    bg = BG_PARAMS.get(back_color)
+    if bg is None:
+        bg = BG_PARAMS.get(back_color.strip().lower(), "")
+    params = ";".join(param for param in (STYLE_PARAMS[mask], fg, bg) if param)
+    return f"\x1b[{params}m" if params else ""
+
+
+def _join_objects(objects: Tuple[Any, ...], sep: str) -> str:
+    """Text print() would write for objects, without the line ending.
+
+    As with print(), a sep of None means a single space; the writers likewise
+    treat an end of None as a newline. Most calls print a single object, which
+    needs no map()/join(). The writers put prefix, this body, reset and end
+    together in one f-string, so each line is built in a single allocation
+    and goes out in one write.
+    """
+    if len(objects) == 1:
+        body = objects[0]
+        return body if type(body) is str else str(body)
+    return (" " if sep is None else sep).join(map(str, objects))
+
+
+def _print_ansi(*objects: Any,
+                sep: str = " ",
+                end: str = "\n",
+                file: Optional[TextIO] = None,
+                flush: bool = False,
+                reset: bool = True,
+                ansi_list: Optional[List[str]] = None) -> None:
+    """Core printer that injects ANSI sequences and resets formatting.
+
+    Args:
+        *objects (Any): Objects to print.
+        sep (str): Separator between objects.
+        end (str): Line ending.
+        file (TextIO, optional): Output file-like object.
+        flush (bool): Whether to flush the output buffer.
+        reset (bool): Append ANSI reset code after printing.
+        ansi_list (List[str], optional): ANSI sequences to prepend.
+    """
+    if file is None:
+        file = sys.stdout
+    if end is None:
+        end = "\n"
+    prefix = "".join(ansi_list) if (ansi_list and _color_enabled) else ""
+    # Only reset if codes were actually emitted (ansi_list may hold just "")
+    suffix = _reset_suffix(file) if (prefix and reset) else ""
+    file.write(f"{prefix}{_join_objects(objects, sep)}{suffix}{end}")
+    if flush:
+        file.flush()
+
+
+def _print_formatted(*objects: Any,
+                     sep: str = " ",
+                     end: str = "\n",
+                     file: Optional[TextIO] = None,
+                     flush: bool = False,
+                     bold: bool = False,
+                     dim: bool = False,
+                     italic: bool = False,
+                     underline: bool = False,
+                     blink: bool = False,
+                     inverse: bool = False,
+                     hidden: bool = False,
+                     strikethrough: bool = False,
+                     color: str = "",
+                     back_color: str = "",
+                     reset = True) -> None:
+    """Print text with a combination of styles and named colors.
+
+    Args:
+        *objects (Any): Objects to print.
+        sep (str): Separator between objects.
+        end (str): Line ending.
+        file (TextIO, optional): Output file-like object.
+        flush (bool): Whether to flush the output buffer.
+        bold (bool): Apply bold style.
+        dim (bool): Apply dim style.
+        italic (bool): Apply italic style.
+        underline (bool): Apply underline style.
+        blink (bool): Apply blink style.
+        inverse (bool): Apply inverse style.
+        hidden (bool): Apply hidden style.
+        strikethrough (bool): Apply strikethrough style.
+        color (str): Named foreground color.
+        back_color (str): Named background color.
+    """
+    prefix = _style_prefix(bold, dim, italic, underline, blink, inverse,
+                           hidden, strikethrough, color, back_color)
+    _print_ansi(*objects, sep=sep, end=end, file=file, flush=flush,
+                reset=reset, ansi_list=[prefix] if prefix else None)
+
+
+def _print_rgb(*objects: Any,
+               sep: str = " ",
+               end: str = "\n",
+               file: Optional[TextIO] = None,
+               flush: bool = False,
+               reset: bool = True,
+               r: int = 0,
+               g: int = 0,
+               b: int = 0,
+               background: bool = False) -> None:
+    """Print text with a custom RGB color.
+
+    Args:
+        *objects (Any): Objects to print.
+        sep (str): Separator between objects.
+        end (str): Line ending.
+        file (TextIO, optional): Output file-like object.
+        flush (bool): Whether to flush the output buffer.
+        reset (bool): Append ANSI reset after text.
+        r (int): Red component (0–255).
+        g (int): Green component (0–255).
+        b (int): Blue component (0–255).
+        background (bool): True for background color, False for foreground.
+    """
+    seq = _build_ansi_sequence(fg=not background, r=r, g=g, b=b)
+    _print_ansi(*objects, sep=sep, end=end, file=file,
+                flush=flush, reset=reset, ansi_list=[seq])
+
+
+def _color_sequence(table: Mapping[str, Any], color: str) -> Any:
+    """Look up a named color's escape in table, falling back to DEFAULT_COLOR.
+
+    Names that miss as given are retried stripped and lower-cased. Works for
+    both the str (FG_ANSI/BG_ANSI) and bytes (FG_ANSI_B/BG_ANSI_B) tables.
+    """
+    seq = table.get(color)
+    if seq is None:
+        seq = table.get(color.strip().lower()) or table[DEFAULT_COLOR]
+    return seq
+
+
+def _print_color(*objects: Any,
+                 sep: str = " ",
+                 end: str = "\n",
+                 file: Optional[TextIO] = None,
+                 flush: bool = False,
+                 color: str = DEFAULT_COLOR,
+                 background: bool = False,
+                 reset: bool = True) -> None:
+    """Print text with a named color, defaulting to white.
+
+    Args:
+        *objects (Any): Objects to print.
+        sep (str): Separator between objects.
+        end (str): Line ending.
+        file (TextIO, optional): Output file-like object.
+        flush (bool): Whether to flush the output buffer.
+        color (str): Named color (falls back to DEFAULT_COLOR).
+        background (bool): True for background color, False for foreground.
+    """
+    seq = _color_sequence(BG_ANSI if background else FG_ANSI, color)
+    _print_ansi(*objects, sep=sep, end=end, file=file, flush=flush,
+                reset=reset, ansi_list=[seq])
+
+
+def _print_color_bytes(*objects: Any,
+                       sep: str = " ",
+                       end: str = "\n",
+                       file: Optional[TextIO] = None,
+                       flush: bool = False,
+                       color: str = DEFAULT_COLOR,
+                       background: bool = False,
+                       reset: bool = True) -> None:
+    """Print text with a named color through the stream's binary buffer.
+
+    The escape codes come pre-encoded, so only the text itself goes through
+    the encoder. The stream is flushed before the bytes are written, so text
+    still pending in its text layer (from print(), or a styled() prefix)
+    comes out first; that makes every call a write to the underlying stream.
+    Streams without a binary buffer (e.g. io.StringIO) fall back to
+    _print_color().
+
+    Args:
+        *objects (Any): Objects to print.
+        sep (str): Separator between objects.
+        end (str): Line ending.
+        file (TextIO, optional): Output file-like object.
+        flush (bool): Whether to flush the output buffer.
+        color (str): Named color (falls back to DEFAULT_COLOR).
+        background (bool): True for background color, False for foreground.
+        reset (bool): Append ANSI reset after text.
+    """
+    stream = sys.stdout if file is None else file
+    buffer = getattr(stream, "buffer", None)
+    if buffer is None or not _color_enabled:
+        _print_color(*objects, sep=sep, end=end, file=stream, flush=flush,
+                     color=color, background=background, reset=reset)
+        return
+    seq = _color_sequence(BG_ANSI_B if background else FG_ANSI_B, color)
+    if end is None:
+        end = "\n"
+    encoding = stream.encoding or "utf-8"
+    errors = stream.errors or "strict"
+    # Text written earlier may still sit in the text layer, above buffer
+    stream.flush()
+    # The color escape is already bytes; the text, reset and line ending are
+    # encoded together in one call, then everything goes out in one write.
+    tail = _reset_suffix(stream) + end if reset else end
+    buffer.write(seq + (_join_objects(objects, sep) + tail).encode(encoding, errors))
+    if flush:
+        buffer.flush()
+
+
+def _print_hyperlink(text: str = '',
+                     hyperlink: str = '',
+                     sep: str = " ",
+                     end: str = "\n",
+                     file: Optional[TextIO] = None,
+                     flush: bool = False,
+                     bold: bool = False,
+                     dim: bool = False,
+                     italic: bool = False,
+                     underline: bool = True,
+                     blink: bool = False,
+                     inverse: bool = False,
+                     hidden: bool = False,
+                     strikethrough: bool = False,
+                     color: str = "",
+                     back_color: str = "",
+                     reset = True) -> None:
+    """Print hyperlink
+
+    Args:
+        *objects (Any): clickable text to display.
+        hyperlink (str): link location
+        sep (str): Separator between objects.
+        end (str): Line ending.
+        file (TextIO, optional): Output file-like object.
+        flush (bool): Whether to flush the output buffer.
+        bold (bool): Apply bold style.
+        dim (bool): Apply dim style.
+        italic (bool): Apply italic style.
+        underline (bool): Apply underline style.
+        blink (bool): Apply blink style.
+        inverse (bool): Apply inverse style.
+        hidden (bool): Apply hidden style.
+        strikethrough (bool): Apply strikethrough style.
+        color (str): Named foreground color.
+        back_color (str): Named background color.
+    """
+    if file is None:
+        file = sys.stdout
+    if end is None:
+        end = "\n"
+    if not _color_enabled:
+        # No escapes at all, so only the visible link text is left
+        file.write(f"{text}{end}")
+        if flush:
+            file.flush()
+        return
+    # Build the OSC 8 link and its styling in one go and write it directly
+    prefix = _style_prefix(bold, dim, italic, underline, blink, inverse,
+                           hidden, strikethrough, color, back_color)
+    suffix = _reset_suffix(file) if (prefix and reset) else ""
+    # Same layout as the HYPERLINK template, without parsing it on every call
+    file.write(f"{prefix}\x1B]8;;{hyperlink}\x1B\\{text}\x1B]8;;\x1B\\{suffix}{end}")
+    if flush:
+        file.flush()
+
+
+def _sole_sgr(segment: str) -> str:
+    """Return the segment's only escape if it is one plain SGR, else ""."""
+    start = segment.find("\x1b")
+    stop = segment.find("m", start) + 1
+    seq = segment[start:stop]
+    if (start >= 0 and seq[1:2] == "[" and seq[2:-1].replace(";", "").isdigit()
+            and "\x1b" not in segment[stop:]):
+        return seq
+    return ""
+
+
+def _merge_style_runs(text: str) -> str:
+    """Drop resets that the next style would make redundant.
+
+    Back-to-back calls with end="" write "P a R P b R"; this turns that into
+    "P a b R". A reset between two plain named/RGB colors of the same kind
+    (foreground to foreground, background to background) is dropped too,
+    since the second color replaces the first: "F1 a R F2 b" -> "F1 a F2 b".
+    Resets before a newline, around other escapes (e.g. hyperlinks), before
+    unstyled text, or between styles that don't fully replace each other are
+    kept.
+    """
+    if RESET_SEQ + "\x1b[" not in text:
+        return text
+    parts = text.split(RESET_SEQ)
+    merged = [parts[0]]
+    # The one escape in effect at the end of merged[-1], if it is that simple
+    active = _sole_sgr(parts[0])
+    for part in parts[1:]:
+        last = merged[-1]
+        following = _sole_sgr(part)
+        if (active and following and part.startswith(following)
+                and "\n" not in last[last.rfind(active) + len(active):]):
+            if following == active:
+                merged[-1] = last + part[len(following):]
+                continue
+            kind = following[:7]
+            if (kind in ("\x1b[38;2;", "\x1b[48;2;") and active.startswith(kind)
+                    and following.count(";") == active.count(";") == 4):
+                merged[-1] = last + part
+                active = following
+                continue
+        merged.append(part)
+        active = following
+    return RESET_SEQ.join(merged)
+
+
+class _BatchBuffer(io.TextIOBase):
+    """In-memory stdout stand-in for batched() that forwards text in chunks.
+
+    Text is collected until max_size characters are pending (never, if None)
+    or print(..., flush=True) asks for it, then passed on in one write. It is
+    a regular text stream otherwise: not a tty, writable, with the target's
+    encoding and errors.
+    """
+
+    def __init__(self, target: TextIO, max_size: Optional[int] = None) -> None:
+        super().__init__()
+        self.target = target
+        self.max_size = max_size
+        self.parts: List[str] = []
+        self.size = 0
+        # Set by close(), which hands the target back without flushing it
+        self.released = False
+
+    @property
+    def encoding(self) -> Optional[str]:
+        return getattr(self.target, "encoding", None)
+
+    @property
+    def errors(self) -> Optional[str]:
+        return getattr(self.target, "errors", None)
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, text: str) -> int:
+        if not isinstance(text, str):
+            raise TypeError(f"string argument expected, got '{type(text).__name__}'")
+        if self.closed:
+            raise ValueError("I/O operation on closed file.")
+        self.parts.append(text)
+        self.size += len(text)
+        if self.max_size is not None and self.size >= self.max_size:
+            self.drain()
+        return len(text)
+
+    def drain(self) -> None:
+        """Write out everything collected so far as a single write."""
+        if self.parts:
+            self.target.write(_merge_style_runs("".join(self.parts)))
+            self.parts.clear()
+            self.size = 0
+
+    def flush(self) -> None:
+        self.drain()
+        if not self.released:
+            self.target.flush()
+
+    def close(self) -> None:
+        """Write out what is pending; flushing the target is up to the caller."""
+        self.released = True
+        super().close()
+
+
+@functools.lru_cache(maxsize=128)
+def _compile_style(bold: bool = False,
+                   dim: bool = False,
+                   italic: bool = False,
+                   underline: bool = False,
+                   blink: bool = False,
+                   inverse: bool = False,
+                   hidden: bool = False,
+                   strikethrough: bool = False,
+                   color: str = "",
+                   back_color: str = "",
+                   reset: bool = True) -> Callable[..., None]:
+    """Build a print function with a fixed set of styles baked in.
+
+    The ANSI prefix is resolved once here and written into the generated
+    function as a constant, so each call only joins and writes the text.
+    Results are cached per style combination. The generated function still
+    checks whether color is enabled, and picks its reset with _reset_suffix()
+    so it hands back to an enclosing styled() block, on each call.
+
+    Args:
+        bold (bool): Apply bold style.
+        dim (bool): Apply dim style.
+        italic (bool): Apply italic style.
+        underline (bool): Apply underline style.
+        blink (bool): Apply blink style.
+        inverse (bool): Apply inverse style.
+        hidden (bool): Apply hidden style.
+        strikethrough (bool): Apply strikethrough style.
+        color (str): Named foreground color.
+        back_color (str): Named background color.
+        reset (bool): Append ANSI reset after text.
+
+    Returns:
+        Callable[..., None]: Function taking (*objects, sep, end, file, flush)
+        like print().
+    """
+    prefix = _style_prefix(bold, dim, italic, underline, blink, inverse,
+                           hidden, strikethrough, color, back_color)
+    suffix = "{_reset_suffix(file)}" if (prefix and reset) else ""
+    # The prefix goes into the generated f-string as literal text (its repr
+    # minus the quotes), see _join_objects()
+    line = f"f'{repr(prefix)[1:-1]}{{_join_objects(objects, sep)}}{suffix}{{end}}'"
+    source = (
+        "def styled_print(*objects, sep=' ', end='\\n', file=None, flush=False):\n"
+        "    if file is None:\n"
+        "        file = sys.stdout\n"
+        "    if end is None:\n"
+        "        end = '\\n'\n"
+        "    if _color_enabled:\n"
+        f"        file.write({line})\n"
+        "    else:\n"
+        "        file.write(_join_objects(objects, sep) + end)\n"
+        "    if flush:\n"
+        "        file.flush()\n"
+    )
+    # Run with this module's globals so _color_enabled and _active_style are
+    # looked up live
+    namespace = {}
+    exec(source, globals(), namespace)
+    return namespace["styled_print"]
 
 
 class ColorPrinter:
-    """Utility for printing colored and formatted text using ANSI codes."""
+    """Utility for printing colored and formatted text using ANSI codes.
+
+    The printing logic lives in module-level functions; the methods here
+    delegate to them so existing ColorPrinter users keep working.
+    """
+
+    # Stateless, so instances carry no per-object __dict__
+    __slots__ = ()
 
     # ANSI escape code templates
-    ANSI_BASE = "\x1b[{code}m"
-    RGB_FOREGROUND = "\x1b[38;2;{r};{g};{b}m"
-    RGB_BACKGROUND = "\x1b[48;2;{r};{g};{b}m"
-    HYPERLINK = "\x1B]8;;{hyperlink}\x1B\\{text}\x1B]8;;\x1B\\"
+    ANSI_BASE = ANSI_BASE
+    RGB_FOREGROUND = RGB_FOREGROUND
+    RGB_BACKGROUND = RGB_BACKGROUND
+    HYPERLINK = HYPERLINK
+    RESET_SEQ = RESET_SEQ
 
     # Prefix to mark background-color formats
-    BACK_TAG = "back_"
+    BACK_TAG = BACK_TAG
 
     # Default settings
-    DEFAULT_COLOR = "white"
-    
-    # Predefined HTML-safe color names (add more as needed)
-    ALICEBLUE="aliceblue"
-    ANTIQUEWHITE="antiquewhite"
-    AQUA="aqua"
-    AQUAMARINE="aquamarine"
-    AZURE="azure"
-    BISQUE="bisque"
-    BLANCHEDALMOND="blanchedalmond"
-    BLUE="blue"
-    BLUEVIOLET="blueviolet"
-    BROWN="brown"
-    BURLYWOOD="burlywood"
-    CADETBLUE="cadetblue"
-    CHARTREUSE="chartreuse"
-    CHOCOLATE="chocolate"
-    CORAL="coral"
-    CORNFLOWERBLUE="cornflowerblue"
-    CORNSILK="cornsilk"
-    CRIMSON="crimson"
-    CYAN="cyan"
-    DARKBLUE="darkblue"
-    DARKCYAN="darkcyan"
-    DARKGRAY="darkgray"
-    DARKGREEN="darkgreen"
-    DARKGREY="darkgrey"
-    DARKKHAKI="darkkhaki"
-    DARKMAGENTA="darkmagenta"
-    DARKOLIVEGREEN="darkolivegreen"
-    DARKORANGE="darkorange"
-    DARKORCHID="darkorchid"
-    DARKRED="darkred"
-    DARKSALMON="darksalmon"
-    DARKSEAGREEN="darkseagreen"
-    DARKSLATEBLUE="darkslateblue"
-    DARKSLATEGRAY="darkslategray"
-    DARKSLATEGREY="darkslategrey"
-    DARKTURQUOISE="darkturquoise"
-    DARKVIOLET="darkviolet"
-    DEEPPINK="deeppink"
-    DEEPSKYBLUE="deepskyblue"
-    DIMGRAY="dimgray"
-    DIMGREY="dimgrey"
-    DODGERBLUE="dodgerblue"
-    FIREBRICK="firebrick"
-    FLORALWHITE="floralwhite"
-    FORESTGREEN="forestgreen"
-    FUCHSIA="fuchsia"
-    GAINSBORO="gainsboro"
-    GHOSTWHITE="ghostwhite"
-    GOLD="gold"
-    GRAY="gray"
-    GREEN="green"
-    GREENYELLOW="greenyellow"
-    GREY="grey"
-    HONEYDEW="honeydew"
-    HOTPINK="hotpink"
-    INDIANRED = "indianred"
-    INDIGO="indigo"
-    IVORY="ivory"
-    KHAKI="khaki"
-    LAVENDER="lavender"
-    LAVENDERBLUSH="lavenderblush"
-    LAWNGREEN="lawngreen"
-    LEMONCHIFFON="lemonchiffon"
-    LIGHTBLUE="lightblue"
-    LIGHTCORAL = "lightcoral"
-    LIGHTCYAN="lightcyan"
-    LIGHTGOLDENRODYELLOW="lightgoldenrodyellow"
-    LIGHTGRAY="lightgray"
-    LIGHTGREEN="lightgreen"
-    LIGHTGREY="lightgrey"
-    LIGHTPINK="lightpink"
-    LIGHTSALMON="lightsalmon"
-    LIGHTSALMON="lightsalmon"
-    LIGHTSEAGREEN="lightseagreen"
-    LIGHTSKYBLUE="lightskyblue"
-    LIGHTSLATEGRAY="lightslategray"
-    LIGHTSLATEGREY="lightslategrey"
-    LIGHTSTEELBLUE="lightsteelblue"
-    LIGHTYELLOW="lightyellow"
-    LIME="lime"
-    LIMEGREEN="limegreen"
-    LINEN="linen"
-    MAGENTA="magenta"
-    MEDIUMAQUAMARINE="mediumaquamarine"
-    MEDIUMBLUE="mediumblue"
-    MEDIUMORCHID="mediumorchid"
-    MEDIUMPURPLE="mediumpurple"
-    MEDIUMSEAGREEN="mediumseagreen"
-    MEDIUMSLATEBLUE="mediumslateblue"
-    MEDIUMSLATEBLUE="mediumslateblue"
-    MEDIUMSPRINGGREEN="mediumspringgreen"
-    MEDIUMTURQUOISE="mediumturquoise"
-    MEDIUMVIOLETRED="mediumvioletred"
-    MIDNIGHTBLUE="midnightblue"
-    MINTCREAM="mintcream"
-    MISTYROSE="mistyrose"
-    MOCCASIN="moccasin"
-    NAVY="navy"
-    OLDLACE="oldlace"
-    OLIVE="olive"
-    OLIVEDRAB="olivedrab"
-    ORANGE="orange"
-    ORANGERED="orangered"
-    ORCHID="orchid"
-    PALEGOLDENROD="palegoldenrod"
-    PALEGREEN="palegreen"
-    PALETURQUOISE="paleturquoise"
-    PALEVIOLETRED="palevioletred"
-    PAPAYAWHIP="papayawhip"
-    PEACHPUFF="peachpuff"
-    PERU="peru"
-    PINK="pink"
-    PLUM="plum"
-    POWDERBLUE="powderblue"
-    PURPLE="purple"
-    REBECCAPURPLE="rebeccapurple"
-    RED="red"
-    ROSYBROWN="rosybrown"
-    ROYALBLUE="royalblue"
-    SADDLEBROWN="saddlebrown"
-    SALMON = "salmon"
-    SANDYBROWN="sandybrown"
-    SEAGREEN="seagreen"
-    SEASHELL="seashell"
-    SIENNA="sienna"
-    SILVER="silver"
-    SKYBLUE="skyblue"
-    SLATEBLUE="slateblue"
-    SLATEGRAY="slategray"
-    SLATEGREY="slategrey"
-    SNOW="snow"
-    SPRINGGREEN="springgreen"
-    STEELBLUE="steelblue"
-    TAN="tan"
-    TEAL="teal"
-    THISTLE="thistle"
-    TOMATO="tomato"
-    TURQUOISE="turquoise"
-    VIOLET="violet"
-    WHEAT="wheat"
-    WHITE="white"
-    WHITESMOKE="whitesmoke"
-    YELLOW="yellow"
-    YELLOWGREEN="yellowgreen"
-
-
-    # RGB mappings for named colors
-    COLOR_RGB = {
-        ALICEBLUE:(240,248,255),
-        ANTIQUEWHITE:(250,235,215),
-        AQUA:(0,255,255),
-        AQUAMARINE:(127,255,212),
-        AZURE:(240,255,255),
-        BISQUE:(255,228,196),
-        BLANCHEDALMOND:(255,235,205),
-        BLUE:(0,0,255),
-        BLUEVIOLET:(138,43,226),
-        BROWN:(165,42,42),
-        BURLYWOOD:(222,184,135),
-        CADETBLUE:(95,158,160),
-        CHARTREUSE:(127,255,0),
-        CHOCOLATE:(210,105,30),
-        CORAL:(255,127,80),
-        CORNFLOWERBLUE:(100,149,237),
-        CORNSILK:(255,248,220),
-        CRIMSON:(220,20,60),
-        CYAN:(0,255,255),
-        DARKBLUE:(0,0,139),
-        DARKCYAN:(0,139,139),
-        DARKGRAY:(169,169,169),
-        DARKGREEN:(0,100,0),
-        DARKGREY:(169,169,169),
-        DARKKHAKI:(189,183,107),
-        DARKMAGENTA:(139,0,139),
-        DARKOLIVEGREEN:(85,107,47),
-        DARKORANGE:(255,140,0),
-        DARKORCHID:(153,50,204),
-        DARKRED:(139,0,0),
-        DARKSALMON:(233,150,122),
-        DARKSEAGREEN:(143,188,139),
-        DARKSLATEBLUE:(72,61,139),
-        DARKSLATEGRAY:(47,79,79),
-        DARKSLATEGREY:(47,79,79),
-        DARKTURQUOISE:(0,206,209),
-        DARKVIOLET:(148,0,211),
-        DEEPPINK:(255,20,147),
-        DEEPSKYBLUE:(0,191,255),
-        DIMGRAY:(105,105,105),
-        DIMGREY:(105,105,105),
-        DODGERBLUE:(30,144,255),
-        FIREBRICK:(178,34,34),
-        FLORALWHITE:(255,250,240),
-        FORESTGREEN:(34,139,34),
-        FUCHSIA:(255,0,255),
-        GAINSBORO:(220,220,220),
-        GHOSTWHITE:(248,248,255),
-        GOLD:(255,215,0),
-        GRAY:(128,128,128),
-        GREEN:(0,128,0),
-        GREENYELLOW:(173,255,47),
-        GREY:(128,128,128),
-        HONEYDEW:(240,255,240),
-        HOTPINK:(255,105,180),
-        INDIANRED: (205, 92, 92),
-        INDIGO:(75,0,130),
-        IVORY:(255,255,240),
-        KHAKI:(240,230,140),
-        LAVENDER:(230,230,250),
-        LAVENDERBLUSH:(255,240,245),
-        LAWNGREEN:(124,252,0),
-        LEMONCHIFFON:(255,250,205),
-        LIGHTBLUE:(173,216,230),
-        LIGHTCORAL: (240, 128, 128),
-        LIGHTCYAN:(224,255,255),
-        LIGHTGOLDENRODYELLOW:(250,250,210),
-        LIGHTGRAY:(211,211,211),
-        LIGHTGREEN:(144,238,144),
-        LIGHTGREY:(211,211,211),
-        LIGHTPINK:(255,182,193),
-        LIGHTSALMON:(255,160,122),
-        LIGHTSALMON:(255,160,122),
-        LIGHTSEAGREEN:(32,178,170),
-        LIGHTSKYBLUE:(135,206,250),
-        LIGHTSLATEGRAY:(119,136,153),
-        LIGHTSLATEGREY:(119,136,153),
-        LIGHTSTEELBLUE:(176,196,222),
-        LIGHTYELLOW:(255,255,224),
-        LIME:(0,255,0),
-        LIMEGREEN:(50,205,50),
-        LINEN:(250,240,230),
-        MAGENTA:(255,0,255),
-        MEDIUMAQUAMARINE:(102,205,170),
-        MEDIUMBLUE:(0,0,205),
-        MEDIUMORCHID:(186,85,211),
-        MEDIUMPURPLE:(147,112,219),
-        MEDIUMSEAGREEN:(60,179,113),
-        MEDIUMSLATEBLUE:(123,104,238),
-        MEDIUMSLATEBLUE:(123,104,238),
-        MEDIUMSPRINGGREEN:(0,250,154),
-        MEDIUMTURQUOISE:(72,209,204),
-        MEDIUMVIOLETRED:(199,21,133),
-        MIDNIGHTBLUE:(25,25,112),
-        MINTCREAM:(245,255,250),
-        MISTYROSE:(255,228,225),
-        MOCCASIN:(255,228,181),
-        NAVY:(0,0,128),
-        OLDLACE:(253,245,230),
-        OLIVE:(128,128,0),
-        OLIVEDRAB:(107,142,35),
-        ORANGE:(255,165,0),
-        ORANGERED:(255,69,0),
-        ORCHID:(218,112,214),
-        PALEGOLDENROD:(238,232,170),
-        PALEGREEN:(152,251,152),
-        PALETURQUOISE:(175,238,238),
-        PALEVIOLETRED:(219,112,147),
-        PAPAYAWHIP:(255,239,213),
-        PEACHPUFF:(255,218,185),
-        PERU:(205,133,63),
-        PINK:(255,192,203),
-        PLUM:(221,160,221),
-        POWDERBLUE:(176,224,230),
-        PURPLE:(128,0,128),
-        REBECCAPURPLE:(102,51,153),
-        RED:(255,0,0),
-        ROSYBROWN:(188,143,143),
-        ROYALBLUE:(65,105,225),
-        SADDLEBROWN:(139,69,19),
-        SALMON: (250, 128, 114),
-        SANDYBROWN:(244,164,96),
-        SEAGREEN:(46,139,87),
-        SEASHELL:(255,245,238),
-        SIENNA:(160,82,45),
-        SILVER:(192,192,192),
-        SKYBLUE:(135,206,235),
-        SLATEBLUE:(106,90,205),
-        SLATEGRAY:(112,128,144),
-        SLATEGREY:(112,128,144),
-        SNOW:(255,250,250),
-        SPRINGGREEN:(0,255,127),
-        STEELBLUE:(70,130,180),
-        TAN:(210,180,140),
-        TEAL:(0,128,128),
-        THISTLE:(216,191,216),
-        TOMATO:(255,99,71),
-        TURQUOISE:(64,224,208),
-        VIOLET:(238,130,238),
-        WHEAT:(245,222,179),
-        WHITE:(255,255,255),
-        WHITESMOKE:(245,245,245),
-        YELLOW:(255,255,0),
-        YELLOWGREEN:(154,205,50)
-    }
+    DEFAULT_COLOR = DEFAULT_COLOR
+
+    # RGB mappings for named colors (the upper-case name constants,
+    # e.g. ColorPrinter.RED == "red", are generated from this after the class)
+    COLOR_RGB = COLOR_RGB
 
     # Text style keywords
     BOLD = "bold"
@@ -340,271 +916,108 @@ class ColorPrinter:
     RESET = "reset"
 
     # ANSI codes for text styles
-    FORMAT_CODES = {
-        RESET: "0",
-        BOLD: "1",
-        DIM: "2",
-        ITALIC: "3",
-        UNDERLINE: "4",
-        BLINK: "5",
-        INVERSE: "7",
-        HIDDEN: "8",
-        STRIKETHROUGH: "9",
-    }
+    FORMAT_CODES = FORMAT_CODES
+    FORMAT_ANSI = FORMAT_ANSI
 
     def _build_ansi_sequence(self, *, fg: bool = True, r: int = 0, g: int = 0,
                              b: int = 0) -> str:
-        """Build an ANSI sequence for an RGB color.
+        """Build an ANSI sequence for an RGB color. See _build_ansi_sequence()."""
+        return _build_ansi_sequence(fg=fg, r=r, g=g, b=b)
 
-        Args:
-            fg (bool): True for foreground, False for background.
-            r (int): Red component (0–255).
-            g (int): Green component (0–255).
-            b (int): Blue component (0–255).
-
-        Returns:
-            str: ANSI escape sequence for the specified RGB color.
-        """
-        template = self.RGB_FOREGROUND if fg else self.RGB_BACKGROUND
-        return template.format(r=r, g=g, b=b)
+    def ansi_for_rgb(self, r: int, g: int, b: int, background: bool = False) -> str:
+        """Return the escape that print_rgb() would use, without printing anything."""
+        return _build_ansi_sequence(fg=not background, r=r, g=g, b=b)
 
     def collect_codes(self, formats: List[str]) -> List[str]:
-        """Convert style names and color tags into ANSI code sequences.
+        """Convert style names and color tags into ANSI code sequences. See _collect_codes()."""
+        return _collect_codes(formats)
+
+    def style_prefix(self,
+                     bold: bool = False,
+                     dim: bool = False,
+                     italic: bool = False,
+                     underline: bool = False,
+                     blink: bool = False,
+                     inverse: bool = False,
+                     hidden: bool = False,
+                     strikethrough: bool = False,
+                     color: str = "",
+                     back_color: str = "") -> str:
+        """Return the ANSI sequence for styles and named colors. See _style_prefix()."""
+        return _style_prefix(bold, dim, italic, underline, blink, inverse,
+                             hidden, strikethrough, color, back_color)
+
+    def print_ansi(self, *objects: Any, **kwargs: Any) -> None:
+        """Core printer that injects ANSI sequences. See _print_ansi()."""
+        return _print_ansi(*objects, **kwargs)
+
+    def print_formatted(self, *objects: Any, **kwargs: Any) -> None:
+        """Print text with styles and named colors. See _print_formatted()."""
+        return _print_formatted(*objects, **kwargs)
+
+    def print_rgb(self, *objects: Any, **kwargs: Any) -> None:
+        """Print text with a custom RGB color. See _print_rgb()."""
+        return _print_rgb(*objects, **kwargs)
+
+    def print_color(self, *objects: Any, **kwargs: Any) -> None:
+        """Print text with a named color. See _print_color()."""
+        return _print_color(*objects, **kwargs)
+
+    def print_color_bytes(self, *objects: Any, **kwargs: Any) -> None:
+        """Print text with a named color as bytes. See _print_color_bytes()."""
+        return _print_color_bytes(*objects, **kwargs)
+
+    def print_hyperlink(self, *args: Any, **kwargs: Any) -> None:
+        """Print a clickable hyperlink. See _print_hyperlink()."""
+        return _print_hyperlink(*args, **kwargs)
+
+    # Build a print function with fixed styles. See _compile_style().
+    compile = staticmethod(_compile_style)
+
+    # Turn escape codes on/off for every print path. See _set_color_enabled().
+    set_color_enabled = staticmethod(_set_color_enabled)
+
+    # Style everything printed inside a with block. See _styled().
+    styled = staticmethod(_styled)
+
+    @staticmethod
+    @contextlib.contextmanager
+    def batched(file: Optional[TextIO] = None,
+                max_size: Optional[int] = None) -> Iterator["ColorPrinter"]:
+        """Collect everything printed to stdout in a block and write it once.
+
+        While the block runs, sys.stdout is redirected to an in-memory buffer,
+        so styled and plain prints keep their order but cost no stream writes.
+        On exit, even on error, the buffer goes to the target in one write,
+        with redundant reset/re-style pairs within a line merged away.
+        A terminal target is flushed right away; pipes and files are left to
+        their own block buffering so consecutive batches share syscalls.
+
+        For long-running blocks, max_size caps how much text is held: once
+        that many characters are pending they are written out early. A
+        print(..., flush=True) inside the block also writes and flushes.
 
         Args:
-            formats (List[str]): List of style keywords or color tags.
-
-        Returns:
-            List[str]: Corresponding list of ANSI sequences.
-        """
-        codes: List[str] = []
-        for fmt in formats:
-            key = fmt.strip().lower()
-            if key in self.FORMAT_CODES:
-                # Text style (bold, underline, reset, etc.)
-                codes.append(self.ANSI_BASE.format(code=self.FORMAT_CODES[key]))
-            else:
-                # Color or background
-                is_background = False
-                if key.startswith(self.BACK_TAG):
-                    is_background = True
-                    key = key[len(self.BACK_TAG):]
-
-                rgb = self.COLOR_RGB.get(key)
-                if rgb:
-                    seq = self._build_ansi_sequence(fg=not is_background,
-                                                    r=rgb[0], g=rgb[1], b=rgb[2])
-                    codes.append(seq)
-        return codes
-
-    def print_ansi(self,
-                    *objects: Any,
-                    sep: str = " ",
-                    end: str = "\n",
-                    file: Optional[TextIO] = None,
-                    flush: bool = False,
-                    reset: bool = True,
-                    ansi_list: Optional[List[str]] = None) -> None:
-        """Core printer that injects ANSI sequences and resets formatting.
-
-        Args:
-            *objects (Any): Objects to print.
-            sep (str): Separator between objects.
-            end (str): Line ending.
-            file (TextIO, optional): Output file-like object.
-            flush (bool): Whether to flush the output buffer.
-            reset (bool): Append ANSI reset code after printing.
-            ansi_list (List[str], optional): ANSI sequences to prepend.
-        """
-        parts = list(map(str, objects))
-        if ansi_list:
-            # Prepend codes to the first piece
-            parts[0] = "".join(ansi_list) + parts[0]
-            if reset:
-                # Append reset code to the last piece
-                reset_seq = self.ANSI_BASE.format(code=self.FORMAT_CODES[self.RESET])
-                parts[-1] = parts[-1] + reset_seq
-
-        print(*parts, sep=sep, end=end, file=file, flush=flush)
-
-    def print_formatted(self,
-                        *objects: Any,
-                        sep: str = " ",
-                        end: str = "\n",
-                        file: Optional[TextIO] = None,
-                        flush: bool = False,
-                        bold: bool = False,
-                        dim: bool = False,
-                        italic: bool = False,
-                        underline: bool = False,
-                        blink: bool = False,
-                        inverse: bool = False,
-                        hidden: bool = False,
-                        strikethrough: bool = False,
-                        color: str = "",
-                        back_color: str = "",
-                        reset = True) -> None:
-        """Print text with a combination of styles and named colors.
+            file (TextIO, optional): Target stream (defaults to sys.stdout).
+            max_size (int, optional): Characters to collect before writing
+                early. None holds everything until the block ends.
 
-        Args:
-            *objects (Any): Objects to print.
-            sep (str): Separator between objects.
-            end (str): Line ending.
-            file (TextIO, optional): Output file-like object.
-            flush (bool): Whether to flush the output buffer.
-            bold (bool): Apply bold style.
-            dim (bool): Apply dim style.
-            italic (bool): Apply italic style.
-            underline (bool): Apply underline style.
-            blink (bool): Apply blink style.
-            inverse (bool): Apply inverse style.
-            hidden (bool): Apply hidden style.
-            strikethrough (bool): Apply strikethrough style.
-            color (str): Named foreground color.
-            back_color (str): Named background color.
-        """
-        fmt_keys: List[str] = []
-        # Map boolean flags to style keywords
-        if bold:
-            fmt_keys.append(self.BOLD)
-        if dim:
-            fmt_keys.append(self.DIM)
-        if italic:
-            fmt_keys.append(self.ITALIC)
-        if underline:
-            fmt_keys.append(self.UNDERLINE)
-        if blink:
-            fmt_keys.append(self.BLINK)
-        if inverse:
-            fmt_keys.append(self.INVERSE)
-        if hidden:
-            fmt_keys.append(self.HIDDEN)
-        if strikethrough:
-            fmt_keys.append(self.STRIKETHROUGH)
-
-        # Add named colors if valid
-        name = color.strip().lower()
-        if name in self.COLOR_RGB:
-            fmt_keys.append(name)
-
-        back_name = back_color.strip().lower()
-        if back_name in self.COLOR_RGB:
-            fmt_keys.append(self.BACK_TAG + back_name)
-
-        ansi_seq = self.collect_codes(fmt_keys)
-        self.print_ansi(*objects, sep=sep, end=end, file=file, flush=flush,
-                         reset=reset, ansi_list=ansi_seq)
-
-    def print_rgb(self,
-                  *objects: Any,
-                  sep: str = " ",
-                  end: str = "\n",
-                  file: Optional[TextIO] = None,
-                  flush: bool = False,
-                  reset: bool = True,
-                  r: int = 0,
-                  g: int = 0,
-                  b: int = 0,
-                  background: bool = False) -> None:
-        """Print text with a custom RGB color.
-
-        Args:
-            *objects (Any): Objects to print.
-            sep (str): Separator between objects.
-            end (str): Line ending.
-            file (TextIO, optional): Output file-like object.
-            flush (bool): Whether to flush the output buffer.
-            reset (bool): Append ANSI reset after text.
-            r (int): Red component (0–255).
-            g (int): Green component (0–255).
-            b (int): Blue component (0–255).
-            background (bool): True for background color, False for foreground.
-        """
-        seq = self._build_ansi_sequence(fg=not background, r=r, g=g, b=b)
-        self.print_ansi(*objects, sep=sep, end=end, file=file,
-                         flush=flush, reset=reset, ansi_list=[seq])
-
-    def print_color(self,
-                    *objects: Any,
-                    sep: str = " ",
-                    end: str = "\n",
-                    file: Optional[TextIO] = None,
-                    flush: bool = False,
-                    color: str = DEFAULT_COLOR,
-                    background: bool = False,
-                    reset: bool = True) -> None:
-        """Print text with a named color, defaulting to white.
-
-        Args:
-            *objects (Any): Objects to print.
-            sep (str): Separator between objects.
-            end (str): Line ending.
-            file (TextIO, optional): Output file-like object.
-            flush (bool): Whether to flush the output buffer.
-            color (str): Named color (falls back to DEFAULT_COLOR).
-            background (bool): True for background color, False for foreground.
-        """
-        name = color.strip().lower()
-        rgb = self.COLOR_RGB.get(name, self.COLOR_RGB[self.DEFAULT_COLOR])
-        self.print_rgb(*objects, sep=sep, end=end, file=file, flush=flush,
-                       reset=reset, r=rgb[0], g=rgb[1], b=rgb[2],
-                       background=background)
-        
-    def print_hyperlink(self,
-                    text: str = '',
-                    hyperlink: str = '',
-                    sep: str = " ",
-                    end: str = "\n",
-                    file: Optional[TextIO] = None,
-                    flush: bool = False,
-                    bold: bool = False,
-                    dim: bool = False,
-                    italic: bool = False,
-                    underline: bool = True,
-                    blink: bool = False,
-                    inverse: bool = False,
-                    hidden: bool = False,
-                    strikethrough: bool = False,
-                    color: str = "",
-                    back_color: str = "",
-                    reset = True) -> None:
-        """Print hyperlink
-
-        Args:
-            *objects (Any): clickable text to display.
-            hyperlink (str): link location
-            sep (str): Separator between objects.
-            end (str): Line ending.
-            file (TextIO, optional): Output file-like object.
-            flush (bool): Whether to flush the output buffer.
-            bold (bool): Apply bold style.
-            dim (bool): Apply dim style.
-            italic (bool): Apply italic style.
-            underline (bool): Apply underline style.
-            blink (bool): Apply blink style.
-            inverse (bool): Apply inverse style.
-            hidden (bool): Apply hidden style.
-            strikethrough (bool): Apply strikethrough style.
-            color (str): Named foreground color.
-            back_color (str): Named background color.
+        Yields:
+            ColorPrinter: Printer to use inside the block.
         """
-        # add hyperlink 
-        ansi_hyperlink = self.HYPERLINK.format(hyperlink=hyperlink, text=text)
-        self.print_formatted(ansi_hyperlink,
-                            sep = sep,
-                            end = end,
-                            file = file,
-                            flush = flush,
-                            bold = bold,
-                            dim = dim,
-                            italic = italic,
-                            underline = underline,
-                            blink = blink,
-                            inverse = inverse,
-                            hidden = hidden,
-                            strikethrough = strikethrough,
-                            color = color,
-                            back_color = back_color,
-                            reset = reset
-                            )
-        
+        target = sys.stdout if file is None else file
+        buffer = _BatchBuffer(target, max_size)
+        try:
+            with contextlib.redirect_stdout(buffer):
+                yield ColorPrinter()
+        finally:
+            buffer.close()
+            isatty = getattr(target, "isatty", None)
+            if isatty is not None and isatty():
+                target.flush()
+
+
+# Predefined HTML-safe color names as class constants (ColorPrinter.RED == "red")
+for _name in COLOR_RGB:
+    setattr(ColorPrinter, _name.upper(), _name)
+del _name
@@ -0,0 +1,94 @@
+import io
+import unittest
+
+import printpop
+from printpop import color_printer
+
+RESET = "\x1b[0m"
+RED = color_printer.FG_ANSI["red"]
+BLUE = color_printer.FG_ANSI["blue"]
+RED_BACK = color_printer.BG_ANSI["red"]
+BLUE_BACK = color_printer.BG_ANSI["blue"]
+BOLD = color_printer.FORMAT_ANSI["bold"]
+
+
+class MergeStyleRunsTest(unittest.TestCase):
+    """batched() drops only the resets _merge_style_runs() promises to drop."""
+
+    def setUp(self):
+        self._was_enabled = color_printer._color_enabled
+        printpop.force_color(True)
+
+    def tearDown(self):
+        printpop.force_color(self._was_enabled)
+
+    def _batched(self, *calls, max_size=None):
+        target = io.StringIO()
+        with printpop.batched(file=target, max_size=max_size):
+            for call in calls:
+                call()
+        return target.getvalue()
+
+    def test_same_style_runs_are_merged(self):
+        out = self._batched(lambda: printpop.print_red("a", end=""),
+                            lambda: printpop.print_red("b", end=""))
+        self.assertEqual(out, RED + "ab" + RESET)
+
+    def test_reset_before_newline_is_kept(self):
+        out = self._batched(lambda: printpop.print_red("a"),
+                            lambda: printpop.print_red("b"))
+        self.assertEqual(out, RED + "a" + RESET + "\n" + RED + "b" + RESET + "\n")
+
+    def test_reset_before_plain_text_is_kept(self):
+        out = self._batched(lambda: printpop.print_red("a", end=""),
+                            lambda: print("b", end=""))
+        self.assertEqual(out, RED + "a" + RESET + "b")
+
+    def test_foreground_to_foreground_drops_reset(self):
+        out = self._batched(lambda: printpop.print_red("a", end=""),
+                            lambda: printpop.print_blue("b", end=""))
+        self.assertEqual(out, RED + "a" + BLUE + "b" + RESET)
+
+    def test_background_to_background_drops_reset(self):
+        out = self._batched(lambda: printpop.print_red_back("a", end=""),
+                            lambda: printpop.print_blue_back("b", end=""))
+        self.assertEqual(out, RED_BACK + "a" + BLUE_BACK + "b" + RESET)
+
+    def test_foreground_to_background_keeps_reset(self):
+        out = self._batched(lambda: printpop.print_red("a", end=""),
+                            lambda: printpop.print_blue_back("b", end=""))
+        self.assertEqual(out, RED + "a" + RESET + BLUE_BACK + "b" + RESET)
+
+    def test_color_to_style_keeps_reset(self):
+        out = self._batched(lambda: printpop.print_red("a", end=""),
+                            lambda: printpop.print_bold("b", end=""))
+        self.assertEqual(out, RED + "a" + RESET + BOLD + "b" + RESET)
+
+    def test_resets_around_hyperlinks_are_kept(self):
+        link = lambda text: printpop.print_hyperlink(text, "https://example.com", end="")
+        out = self._batched(lambda: link("a"), lambda: link("b"))
+        one = io.StringIO()
+        printpop.print_hyperlink("a", "https://example.com", end="", file=one)
+        printpop.print_hyperlink("b", "https://example.com", end="", file=one)
+        self.assertEqual(out, one.getvalue())
+        self.assertEqual(out.count(RESET), 2)
+
+    def test_reset_inside_user_text(self):
+        # The text after the user's own reset is plain and stays plain
+        out = self._batched(lambda: printpop.print_red("a" + RESET + "c", end=""),
+                            lambda: printpop.print_red("b", end=""))
+        self.assertEqual(out, RED + "a" + RESET + "c" + RESET + RED + "b" + RESET)
+        # A reset right after the style only drops the redundant pair before it
+        out = self._batched(lambda: printpop.print_red("a", end=""),
+                            lambda: printpop.print_red(RESET + "b", end=""))
+        self.assertEqual(out, RED + "a" + RESET + "b" + RESET)
+
+    def test_max_size_drain_does_not_merge_across_split(self):
+        out = self._batched(lambda: printpop.print_red("a", end=""),
+                            lambda: printpop.print_red("b", end=""),
+                            max_size=len(RED) + 1)
+        self.assertEqual(out, RED + "a" + RESET + RED + "b" + RESET)
+
+
+if __name__ == "__main__":
+    unittest.main()
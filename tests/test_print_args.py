@@ -0,0 +1,74 @@
+import io
+import unittest
+
+import printpop
+from printpop import color_printer
+
+
+class NoneSepEndTest(unittest.TestCase):
+    """sep=None and end=None fall back to " " and "\\n", as with print()."""
+
+    def setUp(self):
+        self._was_enabled = color_printer._color_enabled
+
+    def tearDown(self):
+        printpop.force_color(self._was_enabled)
+
+    def _print_all(self, buf):
+        printpop.print_red("a", "b", sep=None, end=None, file=buf)
+        printpop.print_bold("a", "b", sep=None, end=None, file=buf)
+        printpop.print_rgb("a", "b", r=0, g=51, b=102, sep=None, end=None, file=buf)
+        printpop.print_rgb("a", "b", r=1, g=2, b=3, sep=None, end=None, file=buf)
+        printpop.print_formatted("a", "b", italic=True, sep=None, end=None, file=buf)
+        printpop.print_color("a", "b", color="blue", sep=None, end=None, file=buf)
+        printpop.compile_style(bold=True)("a", "b", sep=None, end=None, file=buf)
+        printpop.print_color_bytes("a", "b", color="red", sep=None, end=None, file=buf)
+
+    def test_plain(self):
+        printpop.force_color(False)
+        buf = io.StringIO()
+        self._print_all(buf)
+        printpop.print_hyperlink("a", "https://example.com", end=None, file=buf)
+        self.assertEqual(buf.getvalue(), "a b\n" * 8 + "a\n")
+
+    def test_colored(self):
+        printpop.force_color(True)
+        buf = io.StringIO()
+        self._print_all(buf)
+        printpop.print_hyperlink("a", "https://example.com", end=None, file=buf)
+        lines = buf.getvalue().split("\n")
+        self.assertEqual(len(lines), 10)
+        for line in lines[:8]:
+            self.assertIn("a b\x1b[0m", line)
+        self.assertTrue(lines[8].endswith("\x1b[0m"))
+        self.assertEqual(lines[9], "")
+
+
+class ColorBytesOrderTest(unittest.TestCase):
+    """print_color_bytes() output stays in order with the text layer."""
+
+    def setUp(self):
+        self._was_enabled = color_printer._color_enabled
+        printpop.force_color(True)
+
+    def tearDown(self):
+        printpop.force_color(self._was_enabled)
+
+    def test_pending_text_comes_first(self):
+        raw = io.BytesIO()
+        stream = io.TextIOWrapper(raw, encoding="utf-8", line_buffering=True)
+        stream.write("Status: ")
+        printpop.print_color_bytes("OK", color="green", file=stream)
+        with printpop.styled(file=stream, color="red"):
+            printpop.print_color_bytes("x", color="blue", file=stream)
+        stream.flush()
+        green = color_printer.FG_ANSI["green"]
+        red = color_printer.FG_ANSI["red"]
+        blue = color_printer.FG_ANSI["blue"]
+        expected = (f"Status: {green}OK\x1b[0m\n"
+                    f"{red}{blue}x\x1b[0m{red}\n\x1b[0m")
+        self.assertEqual(raw.getvalue(), expected.encode("utf-8"))
+
+
+if __name__ == "__main__":
+    unittest.main()
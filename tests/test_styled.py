@@ -0,0 +1,76 @@
+import io
+import unittest
+
+import printpop
+from printpop import color_printer
+
+RESET = "\x1b[0m"
+RED = color_printer.FG_ANSI["red"]
+BLUE = color_printer.FG_ANSI["blue"]
+BOLD = color_printer.FORMAT_ANSI["bold"]
+
+
+class StyledBlockTest(unittest.TestCase):
+    """Print calls inside styled() must leave the block's style on afterwards."""
+
+    def setUp(self):
+        self._was_enabled = color_printer._color_enabled
+        printpop.force_color(True)
+
+    def tearDown(self):
+        printpop.force_color(self._was_enabled)
+
+    def test_mixed_prints_restore_block_style(self):
+        buf = io.StringIO()
+        with printpop.styled(file=buf, color="red"):
+            printpop.print_bold("a", file=buf)
+            printpop.print_rgb("b", r=1, g=2, b=3, file=buf)
+            printpop.print_rgb("c", r=0, g=51, b=102, file=buf)
+            printpop.print_formatted("d", italic=True, file=buf)
+            printpop.print_hyperlink("e", "https://example.com", file=buf)
+            printpop.compile_style(underline=True)("f", file=buf)
+            printpop.print_blue("g", file=buf)
+            printpop.print_red("h", file=buf)
+        restore = RESET + RED
+        lines = buf.getvalue().split("\n")
+        self.assertTrue(lines[0].startswith(RED + BOLD + "a"))
+        # Every styled line ends with a reset followed by the block's color
+        for line in lines[:7]:
+            self.assertTrue(line.endswith(restore), repr(line))
+        self.assertEqual(lines[6], BLUE + "g" + restore)
+        # Same color as the block: no codes of its own
+        self.assertEqual(lines[7], "h")
+        # The block itself resets once on exit
+        self.assertEqual(lines[8], RESET)
+
+    def test_other_stream_is_unaffected(self):
+        block, other = io.StringIO(), io.StringIO()
+        with printpop.styled(file=block, color="red"):
+            printpop.print_bold("a", file=other)
+        self.assertEqual(other.getvalue(), BOLD + "a" + RESET + "\n")
+
+    def test_nested_blocks(self):
+        buf = io.StringIO()
+        with printpop.styled(file=buf, color="red"):
+            with printpop.styled(file=buf, color="blue"):
+                printpop.print_bold("a", file=buf)
+            printpop.print_bold("b", file=buf)
+        self.assertEqual(
+            buf.getvalue(),
+            RED + BLUE + BOLD + "a" + RESET + BLUE + "\n" + RESET + RED
+            + BOLD + "b" + RESET + RED + "\n" + RESET,
+        )
+
+    def test_no_style_writes_nothing(self):
+        buf = io.StringIO()
+        with printpop.styled(file=buf, color="notacolor"):
+            printpop.print_bold("a", file=buf)
+        self.assertEqual(buf.getvalue(), BOLD + "a" + RESET + "\n")
+
+    def test_arguments_are_keyword_only(self):
+        with self.assertRaises(TypeError):
+            printpop.styled(True)
+
+
+if __name__ == "__main__":
+    unittest.main()